@@ -1,11 +1,31 @@
 import functools
+import os
+import re
+import sys
+from collections import defaultdict
 from datetime import date as dt_date, time as dt_time, timedelta
-from datetime import datetime
-from typing import Any, Callable, List, Union
+from operator import attrgetter
+from time import monotonic
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from src.shemas import Day, RawTimeData, Schedule, ScheduleType, Slot, TimeSlot, TimeSlotList
+from src.shemas import Day, RawTimeData, RawTimeSlot, Schedule, ScheduleType, Slot, TimeSlot, TimeSlotList
+
+SCHEDULE_TTL = 60.0
+VALIDATE_SCHEDULE = os.environ.get("TRAEKTORY_VALIDATE") == "1"
+
+FORMAT_CACHE_SIZE = 8
+DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+TIME_PATTERN = re.compile(r"([0-9]{1,2}):([0-9]{1,2})")
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+_response_cache: Dict[str, Any] = {}
+_schedule_cache: Dict[str, Any] = {}
+_format_cache: Dict[int, Tuple[RawTimeData, ScheduleType]] = {}
 
 
 def exception_handler(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -30,7 +50,10 @@ def exception_handler(func: Callable[..., Any]) -> Callable[..., Any]:
 
 def request_data() -> RawTimeData:
     """
-    Fetches schedule data from the API endpoint.
+    Fetches schedule data from the API endpoint, reusing a pooled keep-alive connection.
+
+    Repeat requests are conditional (If-None-Match / If-Modified-Since); on 304 Not Modified
+    the previously parsed data is returned without downloading it again.
 
     Returns:
         RawTimeData: Validated schedule data from the API.
@@ -40,23 +63,43 @@ def request_data() -> RawTimeData:
         ValueError: If the received data is invalid.
         Exception: For any other unexpected errors.
     """
-    data = requests.get("https://ofc-test-01.tspb.su/test-task/", timeout=5)
+    headers = {}
+    if _response_cache.get("etag"):
+        headers["If-None-Match"] = _response_cache["etag"]
+    if _response_cache.get("last_modified"):
+        headers["If-Modified-Since"] = _response_cache["last_modified"]
+
+    data = _session.get("https://ofc-test-01.tspb.su/test-task/", headers=headers, timeout=5)
+
+    if data.status_code == 304 and headers:
+        return _response_cache["raw_data"]
 
     if data.status_code != 200:
         raise requests.exceptions.RequestException("Failed to retrieve data.")
 
     try:
-        return RawTimeData.model_validate(data.json())
+        raw_data = RawTimeData.model_validate(data.json())
     except (requests.exceptions.JSONDecodeError, ValueError) as e:
         raise ValueError("Received invalid schedule data.") from e
     except Exception as e:
         raise Exception("An unknown error occurred while requesting schedule data.") from e
 
+    _response_cache.update(
+        etag=data.headers.get("ETag"),
+        last_modified=data.headers.get("Last-Modified"),
+        raw_data=raw_data,
+    )
+    return raw_data
+
 
 def format_data(raw_data: RawTimeData) -> ScheduleType:
     """
     Formats and validates raw schedule data into a structured schedule.
 
+    Results are memoized on the identity of raw_data, so formatting the same payload again is free.
+    Since raw_data is already validated, the schedule is assembled without re-validation unless
+    TRAEKTORY_VALIDATE=1 is set.
+
     Args:
         raw_data (RawTimeData): The raw schedule data to format.
 
@@ -69,25 +112,73 @@ def format_data(raw_data: RawTimeData) -> ScheduleType:
     if not isinstance(raw_data, RawTimeData):
         raise TypeError("Invalid data type.")
 
-    data = {}
+    cached = _format_cache.get(id(raw_data))
+    if cached is not None and cached[0] is raw_data:
+        return cached[1]
+
+    buckets: Dict[int, List[RawTimeSlot]] = defaultdict(list)
+    for timeslot in raw_data.timeslots:
+        buckets[timeslot.day_id].append(timeslot)
 
-    sorted_days = sorted(raw_data.days, key=lambda x: x.date)
+    data = {}
 
-    for day in sorted_days:
+    for day in sorted(raw_data.days, key=attrgetter("date")):
         date = day.date.strftime("%Y-%m-%d")
 
-        timeslots = filter(lambda x: x.day_id == day.id, raw_data.timeslots)
-        sorted_timeslots = sorted(timeslots, key=lambda x: x.start)
+        timeslots = buckets[day.id]
+        timeslots.sort(key=attrgetter("start"))
+
+        if VALIDATE_SCHEDULE:
+            data[date] = (day, TimeSlotList.validate_python(timeslots))
+        else:
+            data[date] = (
+                day,
+                [TimeSlot.model_construct(day_id=ts.day_id, start=ts.start, end=ts.end) for ts in timeslots],
+            )
+
+    schedule = Schedule.validate_python(data) if VALIDATE_SCHEDULE else data
+
+    if len(_format_cache) >= FORMAT_CACHE_SIZE:
+        _format_cache.pop(next(iter(_format_cache)))
+    _format_cache[id(raw_data)] = (raw_data, schedule)
+
+    return schedule
+
 
-        data[date] = (day, TimeSlotList.validate_python(sorted_timeslots))
+def cached_schedule(ttl: float = SCHEDULE_TTL) -> ScheduleType:
+    """
+    Returns the formatted schedule, fetching it from the API only when the cached copy is stale.
+
+    Args:
+        ttl (float, optional): Number of seconds a fetched schedule stays fresh. Defaults to SCHEDULE_TTL.
+
+    Returns:
+        ScheduleType: The formatted schedule.
 
-    return Schedule.validate_python(data)
+    Raises:
+        requests.exceptions.RequestException: If the API request fails and nothing has been cached yet.
+    """
+    now = monotonic()
+    if _schedule_cache and now - _schedule_cache["fetched_at"] < ttl:
+        return _schedule_cache["schedule"]
+
+    try:
+        schedule = format_data(request_data())
+    except requests.exceptions.RequestException:
+        if _schedule_cache:
+            return _schedule_cache["schedule"]
+        raise
+
+    _schedule_cache.update(fetched_at=now, schedule=schedule)
+    return schedule
 
 
 def parse_slot_input(slot: str) -> Slot:
     """
     Parses a string input into a Slot object.
 
+    Parsing results are cached per input string; each call still returns a new Slot.
+
     Args:
         slot (str): A string in the format 'YYYY-MM-DD HH:MM-HH:MM'.
 
@@ -97,15 +188,40 @@ def parse_slot_input(slot: str) -> Slot:
     Raises:
         ValueError: If the input string format is invalid.
     """
-    try:
-        _date, *time = slot.strip().split()
+    date, start, end = parse_slot_fields(slot)
+    return Slot(date=date, start=start, end=end)
 
-        if len(time) == 1:
-            time = time[0].split("-")
 
-        date = datetime.strptime(_date.strip(), "%Y-%m-%d")
-        start = datetime.strptime(time[0], "%H:%M").time()
-        end = datetime.strptime(time[-1], "%H:%M").time()
+@functools.lru_cache(maxsize=256)
+def parse_slot_fields(slot: str) -> Tuple[dt_date, dt_time, dt_time]:
+    """
+    Parses a string input into its date, start time and end time.
+
+    Args:
+        slot (str): A string in the format 'YYYY-MM-DD HH:MM-HH:MM'.
+
+    Returns:
+        Tuple[dt_date, dt_time, dt_time]: The date, start time and end time of the slot.
+
+    Raises:
+        ValueError: If the input string format is invalid.
+    """
+    try:
+        _date, time_range = slot.split(maxsplit=1)
+        if "-" in time_range:
+            start_str, end_str = time_range.split("-", 1)
+        else:
+            start_str, end_str = time_range.split()
+
+        date_match = DATE_PATTERN.fullmatch(_date)
+        start_match = TIME_PATTERN.fullmatch(start_str.strip())
+        end_match = TIME_PATTERN.fullmatch(end_str.strip())
+        if not (date_match and start_match and end_match):
+            raise ValueError(f"Unexpected date or time fields in {slot!r}.")
+
+        date = dt_date(*map(int, date_match.groups()))
+        start = dt_time(*map(int, start_match.groups()))
+        end = dt_time(*map(int, end_match.groups()))
     except ValueError as e:
         raise ValueError(
             "Invalid slot format. Provide a date and a time range in the format: 'YYYY-MM-DD HH:MM-HH:MM'."
@@ -114,7 +230,7 @@ def parse_slot_input(slot: str) -> Slot:
     if start >= end:
         raise ValueError("Start time must be before end time")
 
-    return Slot(date=date, start=start, end=end)
+    return date, start, end
 
 
 def duration_str_to_timedelta(duration_str: str) -> timedelta:
@@ -145,39 +261,59 @@ def free_slots_at_date(schedule: ScheduleType, date_key: dt_date) -> List[TimeSl
     Raises:
         TypeError: If the date_key is not of type dt_date.
     """
-    Schedule.validate_python(schedule)
+    if VALIDATE_SCHEDULE:
+        Schedule.validate_python(schedule)
 
     if not isinstance(date_key, dt_date):
         raise TypeError("Invalid date key type.")
 
-    str_date = date_key.strftime("%Y-%m-%d")
-
-    if schedule.get(str_date) is None:
+    entry = schedule.get(date_key.strftime("%Y-%m-%d"))
+    if entry is None:
         return []
 
-    day = schedule[str_date][0].model_copy(deep=True)
+    day, busy_slots = entry
+    return free_slots_for_day(day, busy_slots)
 
-    free_slots = []
-    for slot in schedule[str_date][1]:
-        if day.start == slot.start:
-            day.start = slot.end
-        elif day.start < slot.start:
-            free_slots.append(TimeSlot(day_id=slot.day_id, start=day.start, end=slot.start))
-            day.start = slot.end
 
-    if day.start != day.end:
-        free_slots.append(TimeSlot(day_id=day.id, start=day.start, end=day.end))
+def free_slots_for_day(day: Day, busy_slots: List[TimeSlot]) -> List[TimeSlot]:
+    """
+    Finds available time slots within a day given its sorted busy slots.
+
+    Free slots are built with model_construct, as their fields come from already validated models.
+
+    Args:
+        day (Day): The day whose working hours bound the free slots.
+        busy_slots (List[TimeSlot]): The busy slots of the day, sorted by start time.
+
+    Returns:
+        List[TimeSlot]: A list of available time slots for the day.
+    """
+    cursor = day.start
+
+    free_slots = []
+    for slot in busy_slots:
+        if cursor >= day.end:
+            break
+        if cursor == slot.start:
+            cursor = slot.end
+        elif cursor < slot.start:
+            free_slots.append(TimeSlot.model_construct(day_id=slot.day_id, start=cursor, end=slot.start))
+            cursor = slot.end
+
+    if cursor < day.end:
+        free_slots.append(TimeSlot.model_construct(day_id=day.id, start=cursor, end=day.end))
 
     return free_slots
 
 
-def find_suitable_slot(schedule: ScheduleType, duration: timedelta) -> ScheduleType:
+def find_suitable_slot(schedule: ScheduleType, duration: timedelta, first_only: bool = False) -> ScheduleType:
     """
     Finds a suitable slot for the given duration in the schedule.
 
     Args:
         schedule (ScheduleType): The schedule to search in.
         duration (timedelta): The duration for which a slot is needed.
+        first_only (bool, optional): Whether to stop at the earliest suitable slot. Defaults to False.
 
     Returns:
         ScheduleType: A schedule containing the suitable slot.
@@ -189,22 +325,34 @@ def find_suitable_slot(schedule: ScheduleType, duration: timedelta) -> ScheduleT
     if not isinstance(schedule, dict):
         raise TypeError("Invalid schedule type.")
 
-    Schedule.validate_python(schedule)
+    if VALIDATE_SCHEDULE:
+        Schedule.validate_python(schedule)
 
     if not isinstance(duration, timedelta) or duration.total_seconds() <= 0:
         raise ValueError("Invalid duration. Must be a positive timedelta.")
 
+    duration_seconds = duration.total_seconds()
     suitable_schedule = {}
 
-    for key in schedule:
-        _date = datetime.strptime(key, "%Y-%m-%d").date()
-        free_slots = free_slots_at_date(schedule, _date)
-        suitable_slots = list(filter(lambda x: time_diff(x.end, x.start) >= duration, free_slots))
+    for key, (day, busy_slots) in schedule.items():
+        free_slots = free_slots_for_day(day, busy_slots)
+        fitting_slots = (
+            slot for slot in free_slots if time_diff_seconds(slot.end, slot.start) >= duration_seconds
+        )
+        if first_only:
+            first_slot = next(fitting_slots, None)
+            if first_slot is not None:
+                suitable_schedule[key] = (day, [first_slot])
+                break
+            continue
+        suitable_slots = list(fitting_slots)
         if not suitable_slots:
             continue
-        suitable_schedule[key] = (schedule[key][0], suitable_slots)
+        suitable_schedule[key] = (day, suitable_slots)
 
-    return Schedule.validate_python(suitable_schedule)
+    if VALIDATE_SCHEDULE:
+        return Schedule.validate_python(suitable_schedule)
+    return suitable_schedule
 
 
 def check_time_boundaries(slot: Slot, other: Union[Day, TimeSlot]) -> bool:
@@ -237,9 +385,33 @@ def time_diff(time_1: dt_time, time_2: dt_time) -> timedelta:
     Returns:
         timedelta: The difference between the two times.
     """
-    dt1 = datetime.combine(dt_date.min, time_1)
-    dt2 = datetime.combine(dt_date.min, time_2)
-    return dt1 - dt2
+    return timedelta(
+        seconds=(time_1.hour - time_2.hour) * 3600
+        + (time_1.minute - time_2.minute) * 60
+        + (time_1.second - time_2.second),
+        microseconds=time_1.microsecond - time_2.microsecond,
+    )
+
+
+def time_diff_seconds(time_1: dt_time, time_2: dt_time) -> float:
+    """
+    Calculates the difference between two time objects in seconds.
+
+    Intended for cheap comparisons; use time_diff when microseconds must be exact.
+
+    Args:
+        time_1 (dt_time): The first time object.
+        time_2 (dt_time): The second time object.
+
+    Returns:
+        float: The difference between the two times in seconds.
+    """
+    return (
+        (time_1.hour - time_2.hour) * 3600
+        + (time_1.minute - time_2.minute) * 60
+        + (time_1.second - time_2.second)
+        + (time_1.microsecond - time_2.microsecond) / 1_000_000
+    )
 
 
 def can_schedule_slot(slot: Slot, free_slots: List[TimeSlot]) -> bool:
@@ -253,14 +425,13 @@ def can_schedule_slot(slot: Slot, free_slots: List[TimeSlot]) -> bool:
     Returns:
         bool: True if the slot can be scheduled, False otherwise.
     """
-    if not free_slots:
-        return False
-    return any(check_time_boundaries(slot, free_slot) for free_slot in free_slots)
+    start, end = slot.start, slot.end
+    return any(free_slot.start <= start and end <= free_slot.end for free_slot in free_slots)
 
 
 def display_schedule(schedule: ScheduleType, title: str = "", skip_empty: bool = False) -> None:
     """
-    Displays the schedule in a readable format.
+    Displays the schedule in a readable format, writing it to stdout in a single call.
 
     Args:
         schedule (ScheduleType): The schedule to display.
@@ -273,19 +444,24 @@ def display_schedule(schedule: ScheduleType, title: str = "", skip_empty: bool =
     if not schedule:
         raise ValueError("No schedule found.")
 
-    Schedule.validate_python(schedule)
+    if VALIDATE_SCHEDULE:
+        Schedule.validate_python(schedule)
+
+    lines = []
 
     if title:
-        print(f"\n{title:-^40}\n")
+        lines.append(f"\n{title:-^40}\n")
     else:
-        print(f"\n{'-' * 40}\n")
+        lines.append(f"\n{'-' * 40}\n")
 
     for day, day_data in schedule.items():
         if not day_data[1] and skip_empty:
             if not skip_empty:
-                print(f"{day}:\n\tNo slots available for this day.")
+                lines.append(f"{day}:\n\tNo slots available for this day.")
             continue
-        print(f"{day}:")
+        lines.append(f"{day}:")
         for slot in day_data[1]:
-            print(f"\t{slot.start.strftime('%H:%M')} - {slot.end.strftime('%H:%M')}")
-    print(f"\n{'-' * 40}\n")
+            lines.append(f"\t{slot.start.isoformat(timespec='minutes')} - {slot.end.isoformat(timespec='minutes')}")
+    lines.append(f"\n{'-' * 40}\n")
+
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -2,25 +2,25 @@ from datetime import datetime
 from typing import List, Optional
 
 from src.helpers import (
+    cached_schedule,
     can_schedule_slot,
     display_schedule,
     duration_str_to_timedelta, exception_handler,
     find_suitable_slot,
-    format_data,
     free_slots_at_date,
     parse_slot_input,
-    request_data,
 )
 from src.shemas import ScheduleType, TimeSlot
 
 
 @exception_handler
-def check_slot(raw_slot: str) -> bool:
+def check_slot(raw_slot: str, schedule: Optional[ScheduleType] = None) -> bool:
     """
     Checks if a given time slot is available for scheduling.
 
     Args:
         raw_slot (str): A string representing the slot in format 'YYYY-MM-DD HH:MM-HH:MM'.
+        schedule (ScheduleType, optional): An already fetched schedule. Defaults to the cached schedule.
 
     Returns:
         None: Prints the availability status of the slot.
@@ -29,8 +29,8 @@ def check_slot(raw_slot: str) -> bool:
     if slot is None:
         return False
 
-    raw_schedule = request_data()
-    schedule = format_data(raw_schedule)
+    if schedule is None:
+        schedule = cached_schedule()
     free_slots = free_slots_at_date(schedule, slot.date)
 
     if not free_slots:
@@ -45,6 +45,25 @@ def check_slot(raw_slot: str) -> bool:
     return False
 
 
+@exception_handler
+def check_slots(raw_slots: List[str]) -> List[Optional[bool]]:
+    """
+    Checks several time slots against a single fetch of the schedule.
+
+    Args:
+        raw_slots (List[str]): Strings representing the slots in format 'YYYY-MM-DD HH:MM-HH:MM'.
+
+    Returns:
+        List[Optional[bool]]: The availability of each slot, None where the slot could not be checked.
+    """
+    schedule = cached_schedule()
+    results = []
+    for raw_slot in raw_slots:
+        print(f"{raw_slot.strip()}:", end=" ")
+        results.append(check_slot(raw_slot, schedule))
+    return results
+
+
 @exception_handler
 def show_busy() -> ScheduleType:
     """
@@ -53,8 +72,7 @@ def show_busy() -> ScheduleType:
     Returns:
         None: Prints the schedule of busy slots.
     """
-    raw_time_data = request_data()
-    schedule = format_data(raw_time_data)
+    schedule = cached_schedule()
     display_schedule(schedule, title="Busy slots")
     return schedule
 
@@ -71,8 +89,7 @@ def find_free_slots(raw_date: str) -> Optional[List[TimeSlot]]:
         None: Prints the available free slots for the specified date.
     """
     date = datetime.strptime(raw_date.strip(), "%Y-%m-%d").date()
-    raw_time_data = request_data()
-    schedule = format_data(raw_time_data)
+    schedule = cached_schedule()
     free_slots = free_slots_at_date(schedule, date)
 
     if free_slots:
@@ -83,20 +100,20 @@ def find_free_slots(raw_date: str) -> Optional[List[TimeSlot]]:
     return None
 
 @exception_handler
-def find_slot(raw_duration: str) -> Optional[ScheduleType]:
+def find_slot(raw_duration: str, first_only: bool = False) -> Optional[ScheduleType]:
     """
     Finds suitable slots for a given duration in the schedule.
 
     Args:
         raw_duration (str): Duration string in the format 'HH:MM'.
+        first_only (bool, optional): Whether to show only the earliest suitable slot. Defaults to False.
 
     Returns:
         None: Prints all suitable slots that can accommodate the specified duration.
     """
     duration = duration_str_to_timedelta(raw_duration)
-    raw_time_data = request_data()
-    schedule = format_data(raw_time_data)
-    suitable_slots = find_suitable_slot(schedule, duration)
+    schedule = cached_schedule()
+    suitable_slots = find_suitable_slot(schedule, duration, first_only=first_only)
 
     if len(suitable_slots.values()) > 0:
         display_schedule(suitable_slots, title="Suitable free slots", skip_empty=True)
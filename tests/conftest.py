@@ -1,6 +1,7 @@
 import pytest
 from datetime import date, time
 from unittest import mock
+from src import helpers
 from src.shemas import RawTimeData, Slot, TimeSlot, Day
 
 TEST_DATA = {
@@ -56,9 +57,10 @@ def test_day():
 
 @pytest.fixture
 def mock_response():
-    def _mock_response(status=200, json_data=None):
+    def _mock_response(status=200, json_data=None, headers=None):
         mock_resp = mock.Mock()
         mock_resp.status_code = status
+        mock_resp.headers = headers or {}
         mock_resp.json = mock.Mock(return_value=json_data)
         return mock_resp
     return _mock_response
@@ -66,9 +68,19 @@ def mock_response():
 @pytest.fixture
 def mock_request_data(monkeypatch, raw_time_data):
     mock_func = mock.Mock(return_value=raw_time_data)
-    monkeypatch.setattr("src.services.request_data", mock_func)
+    monkeypatch.setattr("src.helpers.request_data", mock_func)
     return mock_func
 
+@pytest.fixture(autouse=True)
+def clear_schedule_cache():
+    helpers._response_cache.clear()
+    helpers._schedule_cache.clear()
+    helpers._format_cache.clear()
+    yield
+    helpers._response_cache.clear()
+    helpers._schedule_cache.clear()
+    helpers._format_cache.clear()
+
 @pytest.fixture
 def mock_display_schedule(monkeypatch):
     mock_func = mock.Mock()
@@ -85,5 +97,6 @@ __all__ = (
     "mock_response",
     "mock_request_data",
     "mock_display_schedule",
+    "clear_schedule_cache",
     "formatted_schedule"
 )
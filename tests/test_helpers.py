@@ -3,17 +3,24 @@ from datetime import date, time, timedelta
 import requests
 from unittest import mock
 
+from src import helpers
 from src.helpers import (
+    cached_schedule,
+    can_schedule_slot,
     check_time_boundaries,
+    display_schedule,
     duration_str_to_timedelta,
     exception_handler,
     find_suitable_slot,
     format_data,
+    free_slots_at_date,
+    free_slots_for_day,
     parse_slot_input,
     request_data,
     time_diff,
+    time_diff_seconds,
 )
-from src.shemas import Day, Slot
+from src.shemas import Day, RawTimeData, Slot, TimeSlot
 
 
 # Exception handling tests
@@ -38,27 +45,84 @@ def test_execute_function_without_exception():
 class TestRequestData:
     def test_fetch_data_successfully(self, raw_time_data, mock_response, monkeypatch):
         mock_resp = mock_response(json_data=raw_time_data.model_dump())
-        monkeypatch.setattr(requests, "get", mock.Mock(return_value=mock_resp))
+        monkeypatch.setattr(helpers._session, "get", mock.Mock(return_value=mock_resp))
         assert request_data() == raw_time_data
 
+    def test_reuse_data_when_not_modified(self, raw_time_data, mock_response, monkeypatch):
+        mock_get = mock.Mock(side_effect=[
+            mock_response(json_data=raw_time_data.model_dump(), headers={"ETag": '"v1"'}),
+            mock_response(status=304),
+        ])
+        monkeypatch.setattr(helpers._session, "get", mock_get)
+        first = request_data()
+        assert request_data() is first
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
     def test_handle_http_error(self, mock_response, monkeypatch):
         mock_resp = mock_response(status=404)
-        monkeypatch.setattr(requests, "get", mock.Mock(return_value=mock_resp))
+        monkeypatch.setattr(helpers._session, "get", mock.Mock(return_value=mock_resp))
         with pytest.raises(requests.exceptions.RequestException):
             request_data()
 
     def test_handle_request_timeout(self, monkeypatch):
-        monkeypatch.setattr(requests, "get", mock.Mock(side_effect=requests.exceptions.Timeout))
+        monkeypatch.setattr(helpers._session, "get", mock.Mock(side_effect=requests.exceptions.Timeout))
         with pytest.raises(requests.exceptions.Timeout):
             request_data()
 
 
+# Schedule cache tests
+class TestCachedSchedule:
+    def test_reuse_fresh_schedule(self, mock_request_data):
+        assert cached_schedule() is cached_schedule()
+        mock_request_data.assert_called_once()
+
+    def test_refetch_stale_schedule(self, mock_request_data):
+        cached_schedule()
+        cached_schedule(ttl=0)
+        assert mock_request_data.call_count == 2
+
+    def test_fallback_to_stale_schedule_on_request_error(self, mock_request_data):
+        schedule = cached_schedule()
+        mock_request_data.side_effect = requests.exceptions.ConnectionError
+        assert cached_schedule(ttl=0) is schedule
+
+    def test_raise_request_error_without_cache(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.helpers.request_data", mock.Mock(side_effect=requests.exceptions.ConnectionError)
+        )
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cached_schedule()
+
+
 # Data formatting and parsing tests
 def test_format_valid_data(raw_time_data):
     result = format_data(raw_time_data)
     assert isinstance(result, dict)
 
 
+def test_format_data_groups_and_sorts_timeslots():
+    raw_data = RawTimeData(
+        days=[
+            {"id": 2, "date": "2024-10-11", "start": "08:00", "end": "17:00"},
+            {"id": 1, "date": "2024-10-10", "start": "09:00", "end": "18:00"},
+        ],
+        timeslots=[
+            {"id": 1, "day_id": 1, "start": "14:00", "end": "15:00"},
+            {"id": 2, "day_id": 2, "start": "09:30", "end": "16:00"},
+            {"id": 3, "day_id": 1, "start": "11:00", "end": "12:00"},
+        ],
+    )
+    result = format_data(raw_data)
+    assert list(result) == ["2024-10-10", "2024-10-11"]
+    assert [slot.start for slot in result["2024-10-10"][1]] == [time(11, 0), time(14, 0)]
+    assert [slot.start for slot in result["2024-10-11"][1]] == [time(9, 30)]
+
+
+def test_format_data_memoized(raw_time_data):
+    assert format_data(raw_time_data) is format_data(raw_time_data)
+    assert format_data(raw_time_data) is not format_data(raw_time_data.model_copy(deep=True))
+
+
 @pytest.mark.parametrize(
     "invalid_input,expected_error",
     [
@@ -76,19 +140,38 @@ def test_format_invalid_data(invalid_input, expected_error):
     "input_str,expected_result",
     [
         ("2024-10-10 14:00-15:00", Slot(date=date(2024, 10, 10), start=time(14, 0), end=time(15, 0))),
+        ("2024-10-10 9:00 - 9:30", Slot(date=date(2024, 10, 10), start=time(9, 0), end=time(9, 30))),
+        ("2024-10-10 14:00 15:00", Slot(date=date(2024, 10, 10), start=time(14, 0), end=time(15, 0))),
     ]
 )
 def test_parse_valid_slot_input(input_str, expected_result):
     assert parse_slot_input(input_str) == expected_result
 
 
+def test_parse_slot_input_returns_fresh_slots():
+    first = parse_slot_input("2024-10-10 14:00-15:00")
+    first.start = time(9, 0)
+    second = parse_slot_input("2024-10-10 14:00-15:00")
+    assert second is not first
+    assert second == Slot(date=date(2024, 10, 10), start=time(14, 0), end=time(15, 0))
+
+
 @pytest.mark.parametrize(
     "invalid_input",
     [
         "2024-10-10 14:00",  # Missing end time
+        "2024-10-10",  # Missing time range
+        "2024-10-10 14:00 15:00 16:00",  # Too many times
         "invalid",  # Completely invalid format
         "2024-13-45 14:00-15:00",  # Invalid date
         "",  # Empty string
+        "2024-10-10 14:00:00-15:00",  # Seconds are not accepted
+        "2024-10-10 25:00-26:00",  # Invalid hour
+        "2024-10-10 1_0:00-1_1:00",  # Underscores in numbers
+        "2024-10-10 +9:00-10:00",  # Signed number
+        "2024-+10-10 09:00-10:00",  # Signed month
+        "24-10-10 09:00-10:00",  # Short year
+        "2024-10-10 009:00-10:00",  # Too many hour digits
     ]
 )
 def test_parse_slot_input_invalid_format(invalid_input):
@@ -109,6 +192,15 @@ def test_duration_str_to_timedelta(duration_str, expected_result):
 
 def test_time_diff():
     assert time_diff(time(14, 30), time(12, 15)) == timedelta(hours=2, minutes=15)
+    assert time_diff(time(12, 15), time(14, 30)) == timedelta(hours=-2, minutes=-15)
+    assert time_diff(time(23, 59, 59, 999_999), time(0, 0, 0, 1)) == timedelta(
+        hours=23, minutes=59, seconds=59, microseconds=999_998
+    )
+
+
+def test_time_diff_seconds():
+    assert time_diff_seconds(time(14, 30, 15), time(12, 15)) == 8115
+    assert time_diff_seconds(time(0, 0, 0, 500_000), time(0, 0)) == 0.5
 
 
 # Time boundary tests
@@ -140,10 +232,68 @@ def test_check_time_boundaries_invalid_type(test_slot):
         check_time_boundaries(test_slot, "invalid")
 
 
+@pytest.mark.parametrize(
+    "slot_time,expected",
+    [
+        ((9, 0, 11, 0), True),   # Fills the first free slot
+        ((13, 0, 14, 0), True),  # Inside the second free slot
+        ((10, 0, 13, 0), False),  # Spans the gap between free slots
+    ]
+)
+def test_can_schedule_slot(slot_time, expected, sample_time_slots):
+    slot = Slot(
+        date=date(2024, 10, 10),
+        start=time(slot_time[0], slot_time[1]),
+        end=time(slot_time[2], slot_time[3])
+    )
+    assert can_schedule_slot(slot, sample_time_slots) is expected
+
+
+def test_can_schedule_slot_without_free_slots(test_slot):
+    assert can_schedule_slot(test_slot, []) is False
+
+
+# Free slot tests
+def test_free_slots_at_date(formatted_schedule, sample_time_slots):
+    assert free_slots_at_date(formatted_schedule, date(2024, 10, 10)) == sample_time_slots
+
+
+def test_free_slots_at_unknown_date(formatted_schedule):
+    assert free_slots_at_date(formatted_schedule, date(2024, 12, 31)) == []
+
+
+def test_free_slots_for_day_with_slot_past_day_end(test_day):
+    busy_slots = [TimeSlot(day_id=1, start=time(17, 0), end=time(19, 0))]
+    assert free_slots_for_day(test_day, busy_slots) == [
+        TimeSlot(day_id=1, start=time(9, 0), end=time(17, 0))
+    ]
+
+
+def test_free_slots_at_date_invalid_key(formatted_schedule):
+    with pytest.raises(TypeError, match="Invalid date key type"):
+        free_slots_at_date(formatted_schedule, "2024-10-10")
+
+
 # Slot finding tests
 def test_find_suitable_slot(formatted_schedule):
     result = find_suitable_slot(formatted_schedule, timedelta(hours=1))
     assert isinstance(result, dict)
+    assert list(result) == ["2024-10-10", "2024-10-11"]
+    assert result["2024-10-11"][1] == [
+        TimeSlot(day_id=2, start=time(8, 0), end=time(9, 30)),
+        TimeSlot(day_id=2, start=time(16, 0), end=time(17, 0)),
+    ]
+
+
+def test_find_suitable_slot_first_only(formatted_schedule):
+    result = find_suitable_slot(formatted_schedule, timedelta(hours=3), first_only=True)
+    assert result == {
+        "2024-10-10": (formatted_schedule["2024-10-10"][0], [TimeSlot(day_id=1, start=time(12, 0), end=time(18, 0))])
+    }
+
+
+def test_find_suitable_slot_first_only_without_match(formatted_schedule):
+    assert find_suitable_slot(formatted_schedule, timedelta(hours=10), first_only=True) == {}
 
 
 @pytest.mark.parametrize(
@@ -156,3 +306,16 @@ def test_find_suitable_slot(formatted_schedule):
 def test_find_suitable_slot_invalid_inputs(invalid_input, duration, expected_error, error_message):
     with pytest.raises(expected_error, match=error_message):
         find_suitable_slot(invalid_input, duration)
+
+
+# Display tests
+def test_display_schedule(formatted_schedule, capsys):
+    display_schedule(formatted_schedule, title="Busy slots")
+    captured = capsys.readouterr()
+    assert "2024-10-10:\n\t11:00 - 12:00\n2024-10-11:\n\t09:30 - 16:00\n" in captured.out
+    assert "Busy slots" in captured.out
+
+
+def test_display_empty_schedule():
+    with pytest.raises(ValueError, match="No schedule found"):
+        display_schedule({})
@@ -2,7 +2,7 @@ import pytest
 from datetime import time
 from unittest import mock
 
-from src.services import check_slot, show_busy, find_free_slots, find_slot
+from src.services import check_slot, check_slots, show_busy, find_free_slots, find_slot
 from src.shemas import TimeSlot
 
 
@@ -34,13 +34,22 @@ def test_check_slot_invalid_inputs(invalid_input, mock_request_data, capsys):
     assert "ERROR:" in captured.out
 
 
-def test_check_slot_no_available_slots(capsys):
-    with mock.patch("src.services.format_data", return_value={}):
+def test_check_slot_no_available_slots(mock_request_data, capsys):
+    with mock.patch("src.helpers.format_data", return_value={}):
         check_slot("2024-12-31 11:00-12:00")
         captured = capsys.readouterr()
         assert "Sorry, no slots are available for the selected date." in captured.out
 
 
+def test_check_slots(mock_request_data, capsys):
+    results = check_slots(["2024-10-10 14:00-15:00", "2024-10-10 11:00-12:00", "invalid"])
+    captured = capsys.readouterr()
+    assert results == [True, False, None]
+    assert "2024-10-10 14:00-15:00: The slot can be scheduled at the selected time" in captured.out
+    assert "invalid: ERROR:" in captured.out
+    mock_request_data.assert_called_once()
+
+
 # Show busy slots tests
 def test_show_busy_successful(mock_request_data, mock_display_schedule):
     show_busy()
@@ -49,7 +58,7 @@ def test_show_busy_successful(mock_request_data, mock_display_schedule):
 
 
 def test_show_busy_handles_errors(monkeypatch, capsys):
-    monkeypatch.setattr("src.services.request_data", mock.Mock(side_effect=Exception("Test error")))
+    monkeypatch.setattr("src.helpers.request_data", mock.Mock(side_effect=Exception("Test error")))
     show_busy()
     captured = capsys.readouterr()
     assert "ERROR:" in captured.out
@@ -67,7 +76,7 @@ def test_show_busy_handles_errors(monkeypatch, capsys):
     ]
 )
 def test_find_free_slots(date_str, expected_result, mock_request_data, formatted_schedule):
-    with mock.patch("src.services.format_data", return_value=formatted_schedule):
+    with mock.patch("src.helpers.format_data", return_value=formatted_schedule):
         slots = find_free_slots(date_str)
         print(slots)
         if expected_result:
@@ -90,7 +99,7 @@ def test_find_free_slots_invalid_date(mock_request_data):
     ]
 )
 def test_find_slot(duration_str, expected_output, mock_request_data, formatted_schedule, capsys):
-    with mock.patch("src.services.format_data", return_value=formatted_schedule):
+    with mock.patch("src.helpers.format_data", return_value=formatted_schedule):
         find_slot(duration_str)
         captured = capsys.readouterr()
         assert expected_output in captured.out